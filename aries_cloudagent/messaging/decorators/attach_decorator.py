@@ -9,6 +9,7 @@ import json
 import uuid
 import copy
 
+from functools import lru_cache
 from typing import Any, Mapping, Sequence, Tuple, Union
 
 from marshmallow import EXCLUDE, fields, pre_load
@@ -195,6 +196,7 @@ class AttachDecoratorDataJWSSchema(BaseModelSchema):
     )
 
 
+@lru_cache(maxsize=1024)
 def did_key(verkey: str) -> str:
     """Qualify verkey into DID key if need be."""
 
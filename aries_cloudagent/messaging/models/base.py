@@ -73,6 +73,8 @@ class BaseModelError(BaseError):
 class BaseModel(ABC):
     """Base model that provides convenience methods."""
 
+    __slots__ = ()
+
     class Meta:
         """BaseModel meta data."""
 
@@ -229,10 +231,17 @@ class BaseModel(ABC):
 
         """
         exclude = resolve_meta_property(self, "repr_exclude", [])
+        if hasattr(self, "__dict__"):
+            attrs = self.__dict__
+        else:
+            slots = (
+                slot
+                for cls in reversed(type(self).__mro__)
+                for slot in cls.__dict__.get("__slots__", ())
+            )
+            attrs = {k: getattr(self, k) for k in slots if hasattr(self, k)}
         items = (
-            "{}={}".format(k, repr(v))
-            for k, v in self.__dict__.items()
-            if k not in exclude
+            "{}={}".format(k, repr(v)) for k, v in attrs.items() if k not in exclude
         )
         return "<{}({})>".format(self.__class__.__name__, ", ".join(items))
 
@@ -263,6 +272,14 @@ class BaseModelSchema(Schema):
                 )
             )
 
+        # Resolve per-schema field metadata once rather than on every load/dump
+        self._dump_only_keys = {
+            field_obj.data_key or field_name
+            for field_name, field_obj in self.fields.items()
+            if field_obj.dump_only
+        }
+        self._skip_values = resolve_meta_property(self, "skip_values", [])
+
     @classmethod
     def _get_model_class(cls):
         """
@@ -300,12 +317,7 @@ class BaseModelSchema(Schema):
         if not data:
             return data
 
-        to_remove = {
-            field_obj.data_key or field_name
-            for field_name, field_obj in self.fields.items()
-            if field_obj.dump_only
-        }
-        for field_name in to_remove:
+        for field_name in self._dump_only_keys:
             if field_name in data:
                 del data[field_name]
         return data
@@ -330,5 +342,5 @@ class BaseModelSchema(Schema):
             Returns this modified data
 
         """
-        skip_vals = resolve_meta_property(self, "skip_values", [])
+        skip_vals = self._skip_values
         return {key: value for key, value in data.items() if value not in skip_vals}
@@ -35,6 +35,24 @@ class SchemaImpl(BaseModelSchema):
             raise ValidationError("")
 
 
+class SlottedModelImpl(BaseModel):
+    __slots__ = ("attr",)
+
+    class Meta:
+        schema_class = "SchemaImpl"
+
+    def __init__(self, *, attr=None):
+        self.attr = attr
+
+
+class SlottedSubModelImpl(SlottedModelImpl):
+    __slots__ = ("sub_attr",)
+
+    def __init__(self, *, attr=None, sub_attr=None):
+        super().__init__(attr=attr)
+        self.sub_attr = sub_attr
+
+
 class TestBase(AsyncTestCase):
     def test_model_validate_fails(self):
         model = ModelImpl(attr="string")
@@ -63,3 +81,8 @@ class TestBase(AsyncTestCase):
         data = "{}{}"
         with self.assertRaises(BaseModelError):
             ModelImpl.from_json(data)
+
+    def test_repr_slots(self):
+        model = SlottedSubModelImpl(attr="a", sub_attr="b")
+        assert not hasattr(model, "__dict__")
+        assert repr(model) == "<SlottedSubModelImpl(attr='a', sub_attr='b')>"
@@ -11,7 +11,12 @@ from aiohttp_apispec import (
 from marshmallow import fields, validate, validates_schema, ValidationError
 
 from ...admin.request_context import AdminRequestContext
-from ...messaging.valid import JSONWebToken, UUIDFour
+from ...messaging.valid import (
+    JSONWebToken,
+    NUM_STR_NATURAL,
+    NUM_STR_WHOLE,
+    UUIDFour,
+)
 from ...messaging.models.base import BaseModelError
 from ...messaging.models.openapi import OpenAPISchema
 from ...multitenant.base import BaseMultitenantManager
@@ -24,6 +29,10 @@ from ...core.profile import ProfileManagerProvider
 
 from ..error import WalletKeyMissingError
 
+WALLET_TYPE_VALIDATOR = validate.OneOf(ProfileManagerProvider.MANAGER_TYPES.keys())
+WALLET_DISPATCH_TYPE_VALIDATOR = validate.OneOf(["default", "both", "base"])
+INDY_WALLET_REQUIRED_FIELDS = frozenset(("wallet_key", "wallet_name"))
+
 
 def format_wallet_record(wallet_record: WalletRecord):
     """Serialize a WalletRecord object."""
@@ -31,8 +40,7 @@ def format_wallet_record(wallet_record: WalletRecord):
     wallet_info = wallet_record.serialize()
 
     # Hide wallet wallet key
-    if "wallet.key" in wallet_info["settings"]:
-        del wallet_info["settings"]["wallet.key"]
+    wallet_info["settings"].pop("wallet.key", None)
 
     return wallet_info
 
@@ -62,9 +70,7 @@ class CreateWalletRequestSchema(OpenAPISchema):
         description="Type of the wallet to create",
         example="indy",
         default="in_memory",
-        validate=validate.OneOf(
-            [wallet_type for wallet_type in ProfileManagerProvider.MANAGER_TYPES]
-        ),
+        validate=WALLET_TYPE_VALIDATOR,
     )
 
     wallet_dispatch_type = fields.Str(
@@ -74,7 +80,7 @@ class CreateWalletRequestSchema(OpenAPISchema):
             both - Dispatch to both webhook targets.",
         example="default",
         default="default",
-        validate=validate.OneOf(["default", "both", "base"]),
+        validate=WALLET_DISPATCH_TYPE_VALIDATOR,
     )
 
     wallet_webhook_urls = fields.List(
@@ -120,9 +126,11 @@ class CreateWalletRequestSchema(OpenAPISchema):
         """
 
         if data.get("wallet_type") == "indy":
-            for field in ("wallet_key", "wallet_name"):
-                if field not in data:
-                    raise ValidationError("Missing required field", field)
+            missing = INDY_WALLET_REQUIRED_FIELDS - data.keys()
+            if missing:
+                raise ValidationError(
+                    {field: ["Missing required field"] for field in sorted(missing)}
+                )
 
 
 class UpdateWalletRequestSchema(OpenAPISchema):
@@ -135,7 +143,7 @@ class UpdateWalletRequestSchema(OpenAPISchema):
             both - Dispatch to both webhook targets.",
         example="default",
         default="default",
-        validate=validate.OneOf(["default", "both", "base"]),
+        validate=WALLET_DISPATCH_TYPE_VALIDATOR,
     )
     wallet_webhook_urls = fields.List(
         fields.Str(
@@ -208,6 +216,16 @@ class WalletListQueryStringSchema(OpenAPISchema):
     """Parameters and validators for wallet list request query string."""
 
     wallet_name = fields.Str(description="Wallet name", example="MyNewWallet")
+    start = fields.Str(
+        description="Start index",
+        required=False,
+        **NUM_STR_WHOLE,
+    )
+    count = fields.Str(
+        description="Maximum number to retrieve",
+        required=False,
+        **NUM_STR_NATURAL,
+    )
 
 
 @docs(tags=["multitenancy"], summary="Query subwallets")
@@ -229,11 +247,17 @@ async def wallets_list(request: web.BaseRequest):
     if wallet_name:
         query["wallet_name"] = wallet_name
 
+    start = request.query.get("start")
+    count = request.query.get("count")
+    start = int(start) if isinstance(start, str) else 0
+    end = start + int(count) if isinstance(count, str) else None
+
     try:
         async with profile.session() as session:
             records = await WalletRecord.query(session, tag_filter=query)
+        # only serialize the requested page of records
+        records = sorted(records, key=lambda w: w.created_at)[start:end]
         results = [format_wallet_record(record) for record in records]
-        results.sort(key=lambda w: w["created_at"])
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
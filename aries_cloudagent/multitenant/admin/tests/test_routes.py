@@ -55,31 +55,34 @@ class TestMultitenantRoutes(AsyncTestCase):
         ) as mock_response:
             wallets = [
                 async_mock.MagicMock(
+                    created_at="1234567890",
                     serialize=async_mock.MagicMock(
                         return_value={
                             "wallet_id": "wallet_id",
                             "created_at": "1234567890",
                             "settings": {"wallet.name": "test"},
                         }
-                    )
+                    ),
                 ),
                 async_mock.MagicMock(
+                    created_at="1234567891",
                     serialize=async_mock.MagicMock(
                         return_value={
                             "wallet_id": "wallet_id",
                             "created_at": "1234567891",
                             "settings": {"wallet.name": "test"},
                         }
-                    )
+                    ),
                 ),
                 async_mock.MagicMock(
+                    created_at="1234567892",
                     serialize=async_mock.MagicMock(
                         return_value={
                             "wallet_id": "wallet_id",
                             "created_at": "1234567892",
                             "settings": {"wallet.name": "test"},
                         }
-                    )
+                    ),
                 ),
             ]
             mock_wallet_record.query = async_mock.CoroutineMock()
@@ -114,13 +117,14 @@ class TestMultitenantRoutes(AsyncTestCase):
         ) as mock_response:
             wallets = [
                 async_mock.MagicMock(
+                    created_at="1234567890",
                     serialize=async_mock.MagicMock(
                         return_value={
                             "wallet_id": "wallet_id",
                             "created_at": "1234567890",
                             "settings": {"wallet.name": "test"},
                         }
-                    )
+                    ),
                 ),
             ]
             mock_wallet_record.query = async_mock.CoroutineMock()
@@ -139,6 +143,37 @@ class TestMultitenantRoutes(AsyncTestCase):
                 }
             )
 
+    async def test_wallets_list_paginate(self):
+        self.request.query = {"start": "1", "count": "1"}
+
+        with async_mock.patch.object(
+            test_module, "WalletRecord", autospec=True
+        ) as mock_wallet_record, async_mock.patch.object(
+            test_module.web, "json_response"
+        ) as mock_response:
+            wallets = [
+                async_mock.MagicMock(
+                    created_at=f"123456789{i}",
+                    serialize=async_mock.MagicMock(
+                        return_value={
+                            "wallet_id": f"wallet_id_{i}",
+                            "created_at": f"123456789{i}",
+                            "settings": {"wallet.name": "test"},
+                        }
+                    ),
+                )
+                for i in range(3)
+            ]
+            mock_wallet_record.query = async_mock.CoroutineMock()
+            mock_wallet_record.query.return_value = [wallets[2], wallets[0], wallets[1]]
+
+            await test_module.wallets_list(self.request)
+            mock_response.assert_called_once_with(
+                {"results": [test_module.format_wallet_record(wallets[1])]}
+            )
+            wallets[0].serialize.assert_not_called()
+            wallets[2].serialize.assert_not_called()
+
     async def test_wallet_create(self):
         body = {
             "wallet_name": "test",
@@ -198,9 +233,16 @@ class TestMultitenantRoutes(AsyncTestCase):
     async def test_wallet_create_schema_validation_fails_indy_no_name_key(self):
         incorrect_body = {"wallet_type": "indy"}
 
-        with self.assertRaises(ValidationError):
+        with self.assertRaises(ValidationError) as context:
             schema = test_module.CreateWalletRequestSchema()
             schema.validate_fields(incorrect_body)
+        assert set(context.exception.messages) == {"wallet_key", "wallet_name"}
+
+    async def test_wallet_create_schema_validation_fails_indy_no_key(self):
+        incorrect_body = {"wallet_type": "indy", "wallet_name": "test"}
+
+        errors = test_module.CreateWalletRequestSchema().validate(incorrect_body)
+        assert errors == {"wallet_key": ["Missing required field"]}
 
     async def test_wallet_create_optional_default_fields(self):
         body = {
@@ -2,12 +2,12 @@
 import json
 import logging
 
-from typing import Optional, Sequence, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 from ....core.error import BaseError
 from ....core.profile import Profile, ProfileSession
 from ....storage.base import BaseStorage
-from ....storage.error import StorageNotFoundError
+from ....storage.error import StorageDuplicateError, StorageNotFoundError
 from ....storage.record import StorageRecord
 from ....wallet.key_type import KeyType
 from ....wallet.did_method import DIDMethod
@@ -535,8 +535,8 @@ class MediationManager:
 
         """
         session = await self._profile.session()
-        to_save: Sequence[RouteRecord] = []
-        to_remove: Sequence[RouteRecord] = []
+        to_add: List[str] = []
+        to_remove: List[str] = []
         for updated in results:
             if updated.result != KeylistUpdated.RESULT_SUCCESS:
                 # TODO better handle different results?
@@ -548,48 +548,77 @@ class MediationManager:
                 )
                 continue
             if updated.action == KeylistUpdateRule.RULE_ADD:
-                # Multi-tenancy uses route record for internal relaying of wallets
-                # So the record could already exist. We update in that case
-                try:
-                    record = await RouteRecord.retrieve_by_recipient_key(
-                        session, updated.recipient_key
+                to_add.append(updated.recipient_key)
+            elif updated.action == KeylistUpdateRule.RULE_REMOVE:
+                to_remove.append(updated.recipient_key)
+
+        # Look up affected routes with one query per action rather than per key
+        to_save: List[RouteRecord] = []
+        if to_add:
+            # Multi-tenancy uses route record for internal relaying of wallets
+            # So the record could already exist. We update in that case
+            existing = {}
+            for record in await RouteRecord.query(
+                session, {"recipient_key": {"$in": to_add}}
+            ):
+                if record.recipient_key in existing:
+                    raise StorageDuplicateError(
+                        "Multiple RouteRecord records located for "
+                        f"{{'recipient_key': '{record.recipient_key}'}}"
                     )
+                existing[record.recipient_key] = record
+            for recipient_key in dict.fromkeys(to_add):
+                record = existing.get(recipient_key)
+                if record:
                     record.connection_id = connection_id
                     record.role = RouteRecord.ROLE_CLIENT
-                except StorageNotFoundError:
+                else:
                     record = RouteRecord(
                         role=RouteRecord.ROLE_CLIENT,
-                        recipient_key=updated.recipient_key,
+                        recipient_key=recipient_key,
                         connection_id=connection_id,
                     )
                 to_save.append(record)
-            elif updated.action == KeylistUpdateRule.RULE_REMOVE:
-                try:
-                    records = await RouteRecord.query(
-                        session,
-                        {
-                            "role": RouteRecord.ROLE_CLIENT,
-                            "connection_id": connection_id,
-                            "recipient_key": updated.recipient_key,
-                        },
-                    )
-                except StorageNotFoundError as err:
-                    LOGGER.error(
-                        "No route found while processing keylist update response: %s",
-                        err,
-                    )
-                else:
-                    if len(records) > 1:
+
+        to_delete: List[RouteRecord] = []
+        if to_remove:
+            try:
+                records = await RouteRecord.query(
+                    session,
+                    {
+                        "role": RouteRecord.ROLE_CLIENT,
+                        "connection_id": connection_id,
+                        "recipient_key": {"$in": to_remove},
+                    },
+                )
+            except StorageNotFoundError as err:
+                LOGGER.error(
+                    "No route found while processing keylist update response: %s",
+                    err,
+                )
+            else:
+                routes = {}
+                for record in records:
+                    routes.setdefault(record.recipient_key, []).append(record)
+                for recipient_key in dict.fromkeys(to_remove):
+                    key_routes = routes.get(recipient_key)
+                    if not key_routes:
+                        LOGGER.error(
+                            "No route found for %s "
+                            "while processing keylist update response",
+                            recipient_key,
+                        )
+                        continue
+                    if len(key_routes) > 1:
                         LOGGER.error(
-                            f"Too many ({len(records)}) routes found "
+                            f"Too many ({len(key_routes)}) routes found "
                             "while processing keylist update response"
                         )
-                    record = records[0]
-                    to_remove.append(record)
+                    to_delete.append(key_routes[0])
 
         for record_for_saving in to_save:
             await record_for_saving.save(session, reason="Route successfully added.")
-        for record_for_removal in to_remove:
+        for record_for_removal in to_delete:
             await record_for_removal.delete_record(session)
 
     async def get_my_keylist(
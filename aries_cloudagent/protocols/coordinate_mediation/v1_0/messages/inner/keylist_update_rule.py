@@ -14,6 +14,8 @@ from ......messaging.valid import INDY_RAW_PUBLIC_KEY
 class KeylistUpdateRule(BaseModel):
     """Class representing a keylist update rule."""
 
+    __slots__ = ("recipient_key", "action")
+
     class Meta:
         """Keylist update metadata."""
 
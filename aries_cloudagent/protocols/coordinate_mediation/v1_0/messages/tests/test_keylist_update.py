@@ -18,3 +18,16 @@ class TestKeylistUpdate(MessageTest, TestCase):
             KeylistUpdateRule("3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx", "add")
         ]
     }
+
+
+class TestKeylistUpdateRule(TestCase):
+    """Test keylist update rule inner object."""
+
+    def test_repr(self):
+        """Test representation of slotted rule."""
+        rule = KeylistUpdateRule("3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx", "add")
+        assert not hasattr(rule, "__dict__")
+        assert repr(rule) == (
+            "<KeylistUpdateRule(recipient_key="
+            "'3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx', action='add')>"
+        )
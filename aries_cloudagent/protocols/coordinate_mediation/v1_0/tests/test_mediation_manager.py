@@ -8,7 +8,7 @@ from asynctest import mock as async_mock
 from .....core.profile import Profile, ProfileSession
 from .....connections.models.conn_record import ConnRecord
 from .....messaging.request_context import RequestContext
-from .....storage.error import StorageNotFoundError
+from .....storage.error import StorageDuplicateError, StorageNotFoundError
 from .....transport.inbound.receipt import MessageReceipt
 
 from ....routing.v1_0.models.route_record import RouteRecord
@@ -412,7 +412,9 @@ class TestMediationManager:  # pylint: disable=R0904,W0621
             test_module.LOGGER, "error", async_mock.MagicMock()
         ) as mock_logger_error:
             mock_route_rec_query.return_value = [
-                async_mock.MagicMock(delete_record=async_mock.CoroutineMock())
+                async_mock.MagicMock(
+                    recipient_key=TEST_VERKEY, delete_record=async_mock.CoroutineMock()
+                )
             ] * 2
 
             await manager.store_update_results(TEST_CONN_ID, results)
@@ -441,6 +443,55 @@ class TestMediationManager:  # pylint: disable=R0904,W0621
         assert route.wallet_id == "test_wallet"
         assert route.connection_id == TEST_CONN_ID
 
+    async def test_store_update_results_add_duplicate_routes(self, session, manager):
+        """test_store_update_results with several routes for an added key."""
+        for wallet_id in ("test_wallet_0", "test_wallet_1"):
+            await RouteRecord(
+                role=RouteRecord.ROLE_CLIENT,
+                recipient_key=TEST_VERKEY,
+                wallet_id=wallet_id,
+            ).save(session)
+        results = [
+            KeylistUpdated(
+                recipient_key=TEST_VERKEY,
+                action=KeylistUpdateRule.RULE_ADD,
+                result=KeylistUpdated.RESULT_SUCCESS,
+            )
+        ]
+        with pytest.raises(StorageDuplicateError):
+            await manager.store_update_results(TEST_CONN_ID, results)
+
+        routes = await RouteRecord.query(session)
+        assert len(routes) == 2
+        assert all(route.connection_id is None for route in routes)
+
+    async def test_store_update_results_remove_absent(self, session, manager):
+        """test_store_update_results with no route for a removed key."""
+        await RouteRecord(
+            role=RouteRecord.ROLE_CLIENT,
+            connection_id=TEST_CONN_ID,
+            recipient_key=TEST_VERKEY,
+        ).save(session)
+        results = [
+            KeylistUpdated(
+                recipient_key=TEST_VERKEY,
+                action=KeylistUpdateRule.RULE_REMOVE,
+                result=KeylistUpdated.RESULT_SUCCESS,
+            ),
+            KeylistUpdated(
+                recipient_key=TEST_ROUTE_VERKEY,
+                action=KeylistUpdateRule.RULE_REMOVE,
+                result=KeylistUpdated.RESULT_SUCCESS,
+            ),
+        ]
+        with async_mock.patch.object(
+            test_module.LOGGER, "error", async_mock.MagicMock()
+        ) as mock_logger_error:
+            await manager.store_update_results(TEST_CONN_ID, results)
+            mock_logger_error.assert_called_once()
+
+        assert not await RouteRecord.query(session)
+
     async def test_store_update_results_errors(self, caplog, manager):
         """test_store_update_results with errors."""
         caplog.set_level(logging.WARNING)
@@ -17,7 +17,6 @@ from .....ledger.base import BaseLedger
 from .....messaging.responder import BaseResponder, MockResponder
 from .....messaging.decorators.attach_decorator import AttachDecorator
 from .....multitenant.base import BaseMultitenantManager
-from .....multitenant.manager import MultitenantManager
 from .....storage.error import StorageNotFoundError
 from .....transport.inbound.receipt import MessageReceipt
 from .....wallet.did_info import DIDInfo
@@ -44,6 +43,11 @@ from ....out_of_band.v1_0.messages.service import Service as OOBService
 from .. import manager as test_module
 from ..manager import DIDXManager, DIDXManagerError
 
+RFC23_HANDSHAKE_PROTOCOLS = tuple(
+    pfx.qualify(HSProto.RFC23.name) for pfx in DIDCommPrefix
+)
+DUMMY_DID_DOC_JSON = json.dumps({"dummy": "did-doc"})
+
 
 class TestConfig:
 
@@ -73,7 +77,60 @@ class TestConfig:
         return doc
 
 
+def make_did_doc_json_no_auth_no_svc(did, verkey):
+    """Serialize a test DID doc without its authentication and service entries."""
+    did_doc_dict = TestConfig().make_did_doc(did=did, verkey=verkey).serialize()
+    del did_doc_dict["authentication"]
+    del did_doc_dict["service"]
+    return json.dumps(did_doc_dict)
+
+
+TARGET_DID_DOC_NO_AUTH_NO_SVC_JSON = make_did_doc_json_no_auth_no_svc(
+    TestConfig.test_target_did, TestConfig.test_target_verkey
+)
+TEST_DID_INFO = DIDInfo(
+    TestConfig.test_did,
+    TestConfig.test_verkey,
+    None,
+    method=DIDMethod.SOV,
+    key_type=KeyType.ED25519,
+)
+
+
+def make_mock_did_doc_attach(decoded):
+    """Mock a verifiable DID doc attachment that decodes to the given value."""
+    return async_mock.MagicMock(
+        data=async_mock.MagicMock(
+            verify=async_mock.CoroutineMock(return_value=True),
+            signed=async_mock.MagicMock(
+                decode=async_mock.MagicMock(return_value=decoded)
+            ),
+        )
+    )
+
+
+def make_mock_attach_deco():
+    """Stub AttachDecorator whose data_base64() attachment can be signed."""
+    return async_mock.MagicMock(
+        data_base64=async_mock.MagicMock(
+            return_value=async_mock.MagicMock(
+                data=async_mock.MagicMock(sign=async_mock.CoroutineMock())
+            )
+        )
+    )
+
+
 class TestDidExchangeManager(AsyncTestCase, TestConfig):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # autospec walks every BaseLedger method: build the mock once per class
+        cls.ledger = async_mock.create_autospec(BaseLedger)
+        cls.ledger.__aenter__ = async_mock.CoroutineMock(return_value=cls.ledger)
+        cls.ledger.get_endpoint_for_did = async_mock.CoroutineMock(
+            return_value=TestConfig.test_endpoint
+        )
+
     async def setUp(self):
         self.responder = MockResponder()
 
@@ -96,14 +153,12 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
                 key_type=KeyType.ED25519,
             )
 
-        self.ledger = async_mock.create_autospec(BaseLedger)
-        self.ledger.__aenter__ = async_mock.CoroutineMock(return_value=self.ledger)
-        self.ledger.get_endpoint_for_did = async_mock.CoroutineMock(
-            return_value=TestConfig.test_endpoint
-        )
+        self.ledger.reset_mock()
         self.context.injector.bind_instance(BaseLedger, self.ledger)
 
-        self.multitenant_mgr = async_mock.MagicMock(MultitenantManager, autospec=True)
+        self.multitenant_mgr = async_mock.MagicMock(
+            BaseMultitenantManager, autospec=True
+        )
         self.context.injector.bind_instance(
             BaseMultitenantManager, self.multitenant_mgr
         )
@@ -119,6 +174,18 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
         self.test_mediator_conn_id = "mediator-conn-id"
         self.test_mediator_endpoint = "http://mediator.example.com"
 
+    async def make_mediation_record(self, session):
+        """Save and return a granted client mediation record for the test mediator."""
+        mediation_record = MediationRecord(
+            role=MediationRecord.ROLE_CLIENT,
+            state=MediationRecord.STATE_GRANTED,
+            connection_id=self.test_mediator_conn_id,
+            routing_keys=self.test_mediator_routing_keys,
+            endpoint=self.test_mediator_endpoint,
+        )
+        await mediation_record.save(session)
+        return mediation_record
+
     async def test_verify_diddoc(self):
         async with self.profile.session() as session:
             did_doc = self.make_did_doc(
@@ -140,18 +207,11 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
     async def test_receive_invitation(self):
         async with self.profile.session() as session:
             self.profile.context.update_settings({"public_invites": True})
-            mediation_record = MediationRecord(
-                role=MediationRecord.ROLE_CLIENT,
-                state=MediationRecord.STATE_GRANTED,
-                connection_id=self.test_mediator_conn_id,
-                routing_keys=self.test_mediator_routing_keys,
-                endpoint=self.test_mediator_endpoint,
-            )
-            await mediation_record.save(session)
+            mediation_record = await self.make_mediation_record(session)
 
             with async_mock.patch.object(
-                test_module, "AttachDecorator", autospec=True
-            ) as mock_attach_deco, async_mock.patch.object(
+                test_module, "AttachDecorator", make_mock_attach_deco()
+            ), async_mock.patch.object(
                 self.multitenant_mgr, "get_default_mediator"
             ) as mock_get_default_mediator:
                 mock_get_default_mediator.return_value = mediation_record
@@ -160,24 +220,12 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
                     hs_protos=[HSProto.RFC23],
                 )
                 invi_msg = invi_rec.invitation
-                mock_attach_deco.data_base64 = async_mock.MagicMock(
-                    return_value=async_mock.MagicMock(
-                        data=async_mock.MagicMock(sign=async_mock.CoroutineMock())
-                    )
-                )
                 invitee_record = await self.manager.receive_invitation(invi_msg)
                 assert invitee_record.state == ConnRecord.State.REQUEST.rfc23
 
     async def test_receive_invitation_no_auto_accept(self):
         async with self.profile.session() as session:
-            mediation_record = MediationRecord(
-                role=MediationRecord.ROLE_CLIENT,
-                state=MediationRecord.STATE_GRANTED,
-                connection_id=self.test_mediator_conn_id,
-                routing_keys=self.test_mediator_routing_keys,
-                endpoint=self.test_mediator_endpoint,
-            )
-            await mediation_record.save(session)
+            mediation_record = await self.make_mediation_record(session)
             with async_mock.patch.object(
                 self.multitenant_mgr, "get_default_mediator"
             ) as mock_get_default_mediator:
@@ -194,32 +242,21 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
                 assert invitee_record.state == ConnRecord.State.INVITATION.rfc23
 
     async def test_receive_invitation_bad_invitation(self):
-        x_invites = [
-            InvitationMessage(),
-            InvitationMessage(services=[OOBService()]),
-            InvitationMessage(
-                services=[
-                    OOBService(
-                        recipient_keys=["3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx"]
-                    )
-                ]
+        x_invites = {
+            "empty": InvitationMessage(),
+            "svc-no-keys": InvitationMessage(services=[OOBService()]),
+            "svc-recipient-only": InvitationMessage(
+                services=[OOBService(recipient_keys=[TestConfig.test_verkey])]
             ),
-        ]
+        }
 
-        for x_invite in x_invites:
-            with self.assertRaises(DIDXManagerError):
+        for case, x_invite in x_invites.items():
+            with self.assertRaises(DIDXManagerError, msg=case):
                 await self.manager.receive_invitation(x_invite)
 
     async def test_create_request_implicit(self):
         async with self.profile.session() as session:
-            mediation_record = MediationRecord(
-                role=MediationRecord.ROLE_CLIENT,
-                state=MediationRecord.STATE_GRANTED,
-                connection_id=self.test_mediator_conn_id,
-                routing_keys=self.test_mediator_routing_keys,
-                endpoint=self.test_mediator_endpoint,
-            )
-            await mediation_record.save(session)
+            mediation_record = await self.make_mediation_record(session)
 
             with async_mock.patch.object(
                 self.manager, "create_did_document", async_mock.CoroutineMock()
@@ -242,14 +279,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
 
     async def test_create_request_implicit_use_public_did(self):
         async with self.profile.session() as session:
-            mediation_record = MediationRecord(
-                role=MediationRecord.ROLE_CLIENT,
-                state=MediationRecord.STATE_GRANTED,
-                connection_id=self.test_mediator_conn_id,
-                routing_keys=self.test_mediator_routing_keys,
-                endpoint=self.test_mediator_endpoint,
-            )
-            await mediation_record.save(session)
+            mediation_record = await self.make_mediation_record(session)
 
             info_public = await session.wallet.create_public_did(
                 DIDMethod.SOV,
@@ -314,23 +344,12 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
         ) as mock_wallet_create_local_did, async_mock.patch.object(
             self.manager, "create_did_document", async_mock.CoroutineMock()
         ) as mock_create_did_doc, async_mock.patch.object(
-            test_module, "AttachDecorator", autospec=True
-        ) as mock_attach_deco:
+            test_module, "AttachDecorator", make_mock_attach_deco()
+        ):
             mock_create_did_doc.return_value = async_mock.MagicMock(
                 serialize=async_mock.MagicMock(return_value={})
             )
-            mock_wallet_create_local_did.return_value = DIDInfo(
-                TestConfig.test_did,
-                TestConfig.test_verkey,
-                None,
-                method=DIDMethod.SOV,
-                key_type=KeyType.ED25519,
-            )
-            mock_attach_deco.data_base64 = async_mock.MagicMock(
-                return_value=async_mock.MagicMock(
-                    data=async_mock.MagicMock(sign=async_mock.CoroutineMock())
-                )
-            )
+            mock_wallet_create_local_did.return_value = TEST_DID_INFO
 
             await self.manager.create_request(
                 async_mock.MagicMock(
@@ -354,20 +373,11 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
 
     async def test_create_request_mediation_id(self):
         async with self.profile.session() as session:
-            mediation_record = MediationRecord(
-                role=MediationRecord.ROLE_CLIENT,
-                state=MediationRecord.STATE_GRANTED,
-                connection_id=self.test_mediator_conn_id,
-                routing_keys=self.test_mediator_routing_keys,
-                endpoint=self.test_mediator_endpoint,
-            )
-            await mediation_record.save(session)
+            mediation_record = await self.make_mediation_record(session)
 
             invi = InvitationMessage(
                 comment="test",
-                handshake_protocols=[
-                    pfx.qualify(HSProto.RFC23.name) for pfx in DIDCommPrefix
-                ],
+                handshake_protocols=RFC23_HANDSHAKE_PROTOCOLS,
                 services=[TestConfig.test_did],
             )
             record = ConnRecord(
@@ -438,25 +448,11 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
         async with self.profile.session() as session:
             mock_request = async_mock.MagicMock(
                 did=TestConfig.test_did,
-                did_doc_attach=async_mock.MagicMock(
-                    data=async_mock.MagicMock(
-                        verify=async_mock.CoroutineMock(return_value=True),
-                        signed=async_mock.MagicMock(
-                            decode=async_mock.MagicMock(return_value="dummy-did-doc")
-                        ),
-                    )
-                ),
+                did_doc_attach=make_mock_did_doc_attach("dummy-did-doc"),
                 _thread=async_mock.MagicMock(pthid="did:sov:publicdid0000000000000"),
             )
 
-            mediation_record = MediationRecord(
-                role=MediationRecord.ROLE_CLIENT,
-                state=MediationRecord.STATE_GRANTED,
-                connection_id=self.test_mediator_conn_id,
-                routing_keys=self.test_mediator_routing_keys,
-                endpoint=self.test_mediator_endpoint,
-            )
-            await mediation_record.save(session)
+            mediation_record = await self.make_mediation_record(session)
 
             await session.wallet.create_local_did(
                 method=DIDMethod.SOV,
@@ -475,8 +471,8 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
             ) as mock_did_doc, async_mock.patch.object(
                 test_module, "DIDPosture", autospec=True
             ) as mock_did_posture, async_mock.patch.object(
-                test_module, "AttachDecorator", autospec=True
-            ) as mock_attach_deco, async_mock.patch.object(
+                test_module, "AttachDecorator", make_mock_attach_deco()
+            ), async_mock.patch.object(
                 test_module, "DIDXResponse", autospec=True
             ) as mock_response, async_mock.patch.object(
                 self.manager, "create_did_document", async_mock.CoroutineMock()
@@ -522,11 +518,6 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
                 mock_did_doc.from_json = async_mock.MagicMock(
                     return_value=async_mock.MagicMock(did=TestConfig.test_did)
                 )
-                mock_attach_deco.data_base64 = async_mock.MagicMock(
-                    return_value=async_mock.MagicMock(
-                        data=async_mock.MagicMock(sign=async_mock.CoroutineMock())
-                    )
-                )
                 mock_response.return_value = async_mock.MagicMock(
                     assign_thread_from=async_mock.MagicMock(),
                     assign_trace_from=async_mock.MagicMock(),
@@ -582,16 +573,6 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
                 method=DIDMethod.SOV,
                 key_type=KeyType.ED25519,
             )
-            did_doc_dict = self.make_did_doc(
-                did=TestConfig.test_target_did,
-                verkey=TestConfig.test_target_verkey,
-            ).serialize()
-            del did_doc_dict["authentication"]
-            del did_doc_dict["service"]
-            new_info = await session.wallet.create_local_did(
-                method=DIDMethod.SOV,
-                key_type=KeyType.ED25519,
-            )
 
             mock_request = async_mock.MagicMock()
             mock_request.connection = async_mock.MagicMock(
@@ -601,15 +582,8 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
             mock_request.connection.did_doc = async_mock.MagicMock()
             mock_request.connection.did_doc.did = TestConfig.test_did
             mock_request.did = self.test_target_did
-            mock_request.did_doc_attach = async_mock.MagicMock(
-                data=async_mock.MagicMock(
-                    verify=async_mock.CoroutineMock(return_value=True),
-                    signed=async_mock.MagicMock(
-                        decode=async_mock.MagicMock(
-                            return_value=json.dumps(did_doc_dict)
-                        )
-                    ),
-                )
+            mock_request.did_doc_attach = make_mock_did_doc_attach(
+                TARGET_DID_DOC_NO_AUTH_NO_SVC_JSON
             )
 
             await session.wallet.create_local_did(
@@ -619,14 +593,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
                 did=TestConfig.test_did,
             )
 
-            mediation_record = MediationRecord(
-                role=MediationRecord.ROLE_CLIENT,
-                state=MediationRecord.STATE_GRANTED,
-                connection_id=self.test_mediator_conn_id,
-                routing_keys=self.test_mediator_routing_keys,
-                endpoint=self.test_mediator_endpoint,
-            )
-            await mediation_record.save(session)
+            mediation_record = await self.make_mediation_record(session)
 
             record = ConnRecord(
                 invitation_key=TestConfig.test_verkey,
@@ -673,16 +640,6 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
                 method=DIDMethod.SOV,
                 key_type=KeyType.ED25519,
             )
-            did_doc_dict = self.make_did_doc(
-                did=TestConfig.test_target_did,
-                verkey=TestConfig.test_target_verkey,
-            ).serialize()
-            del did_doc_dict["authentication"]
-            del did_doc_dict["service"]
-            new_info = await session.wallet.create_local_did(
-                method=DIDMethod.SOV,
-                key_type=KeyType.ED25519,
-            )
 
             mock_request = async_mock.MagicMock()
             mock_request.connection = async_mock.MagicMock(
@@ -691,15 +648,8 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
             mock_request.connection.did = TestConfig.test_did
             mock_request.connection.did_doc = async_mock.MagicMock()
             mock_request.connection.did_doc.did = TestConfig.test_did
-            mock_request.did_doc_attach = async_mock.MagicMock(
-                data=async_mock.MagicMock(
-                    verify=async_mock.CoroutineMock(return_value=True),
-                    signed=async_mock.MagicMock(
-                        decode=async_mock.MagicMock(
-                            return_value=json.dumps(did_doc_dict)
-                        )
-                    ),
-                )
+            mock_request.did_doc_attach = make_mock_did_doc_attach(
+                TARGET_DID_DOC_NO_AUTH_NO_SVC_JSON
             )
 
             await session.wallet.create_local_did(
@@ -709,14 +659,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
                 did=TestConfig.test_did,
             )
 
-            mediation_record = MediationRecord(
-                role=MediationRecord.ROLE_CLIENT,
-                state=MediationRecord.STATE_GRANTED,
-                connection_id=self.test_mediator_conn_id,
-                routing_keys=self.test_mediator_routing_keys,
-                endpoint=self.test_mediator_endpoint,
-            )
-            await mediation_record.save(session)
+            mediation_record = await self.make_mediation_record(session)
 
             record = ConnRecord(
                 invitation_key=TestConfig.test_verkey,
@@ -765,7 +708,6 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
             )
 
             self.profile.context.update_settings({"public_invites": True})
-            mock_conn_rec_state_request = ConnRecord.State.REQUEST
             with async_mock.patch.object(
                 test_module, "ConnRecord", async_mock.MagicMock()
             ) as mock_conn_rec_cls, async_mock.patch.object(
@@ -774,7 +716,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
                 mock_conn_record = async_mock.MagicMock(
                     accept=ConnRecord.ACCEPT_MANUAL,
                     my_did=None,
-                    state=mock_conn_rec_state_request.rfc23,
+                    state=ConnRecord.State.REQUEST.rfc23,
                     attach_request=async_mock.CoroutineMock(),
                     retrieve_request=async_mock.CoroutineMock(),
                     metadata_get_all=async_mock.CoroutineMock(return_value={}),
@@ -807,14 +749,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
         async with self.profile.session() as session:
             mock_request = async_mock.MagicMock(
                 did=TestConfig.test_did,
-                did_doc_attach=async_mock.MagicMock(
-                    data=async_mock.MagicMock(
-                        verify=async_mock.CoroutineMock(return_value=True),
-                        signed=async_mock.MagicMock(
-                            decode=async_mock.MagicMock(return_value="dummy-did-doc")
-                        ),
-                    )
-                ),
+                did_doc_attach=make_mock_did_doc_attach("dummy-did-doc"),
                 _thread=async_mock.MagicMock(pthid="did:sov:publicdid0000000000000"),
             )
 
@@ -826,7 +761,6 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
             )
 
             self.profile.context.update_settings({"public_invites": True})
-            mock_conn_rec_state_request = ConnRecord.State.REQUEST
             with async_mock.patch.object(
                 test_module, "DIDPosture", autospec=True
             ) as mock_did_posture:
@@ -851,14 +785,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
         async with self.profile.session() as session:
             mock_request = async_mock.MagicMock(
                 did=TestConfig.test_did,
-                did_doc_attach=async_mock.MagicMock(
-                    data=async_mock.MagicMock(
-                        verify=async_mock.CoroutineMock(return_value=True),
-                        signed=async_mock.MagicMock(
-                            decode=async_mock.MagicMock(return_value="dummy-did-doc")
-                        ),
-                    )
-                ),
+                did_doc_attach=make_mock_did_doc_attach("dummy-did-doc"),
                 _thread=async_mock.MagicMock(pthid="did:sov:publicdid0000000000000"),
             )
 
@@ -870,7 +797,6 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
             )
 
             self.profile.context.update_settings({"public_invites": True})
-            mock_conn_rec_state_request = ConnRecord.State.REQUEST
             with async_mock.patch.object(
                 test_module, "ConnRecord", async_mock.MagicMock()
             ) as mock_conn_rec_cls, async_mock.patch.object(
@@ -881,7 +807,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
                 mock_conn_record = async_mock.MagicMock(
                     accept=ConnRecord.ACCEPT_MANUAL,
                     my_did=None,
-                    state=mock_conn_rec_state_request.rfc23,
+                    state=ConnRecord.State.REQUEST.rfc23,
                     attach_request=async_mock.CoroutineMock(),
                     retrieve_request=async_mock.CoroutineMock(),
                     metadata_get_all=async_mock.CoroutineMock(return_value={}),
@@ -932,7 +858,6 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
             )
 
             self.profile.context.update_settings({"public_invites": True})
-            mock_conn_rec_state_request = ConnRecord.State.REQUEST
             with async_mock.patch.object(
                 test_module, "ConnRecord", async_mock.MagicMock()
             ) as mock_conn_rec_cls, async_mock.patch.object(
@@ -941,7 +866,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
                 mock_conn_record = async_mock.MagicMock(
                     accept=ConnRecord.ACCEPT_MANUAL,
                     my_did=None,
-                    state=mock_conn_rec_state_request.rfc23,
+                    state=ConnRecord.State.REQUEST.rfc23,
                     attach_request=async_mock.CoroutineMock(),
                     retrieve_request=async_mock.CoroutineMock(),
                     metadata_get_all=async_mock.CoroutineMock(return_value={}),
@@ -972,14 +897,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
         async with self.profile.session() as session:
             mock_request = async_mock.MagicMock(
                 did=TestConfig.test_did,
-                did_doc_attach=async_mock.MagicMock(
-                    data=async_mock.MagicMock(
-                        verify=async_mock.CoroutineMock(return_value=True),
-                        signed=async_mock.MagicMock(
-                            decode=async_mock.MagicMock(return_value="dummy-did-doc")
-                        ),
-                    )
-                ),
+                did_doc_attach=make_mock_did_doc_attach("dummy-did-doc"),
                 _thread=async_mock.MagicMock(pthid="did:sov:publicdid0000000000000"),
             )
 
@@ -1021,14 +939,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
         async with self.profile.session() as session:
             mock_request = async_mock.MagicMock(
                 did=TestConfig.test_did,
-                did_doc_attach=async_mock.MagicMock(
-                    data=async_mock.MagicMock(
-                        verify=async_mock.CoroutineMock(return_value=True),
-                        signed=async_mock.MagicMock(
-                            decode=async_mock.MagicMock(return_value="dummy-did-doc")
-                        ),
-                    )
-                ),
+                did_doc_attach=make_mock_did_doc_attach("dummy-did-doc"),
                 _thread=async_mock.MagicMock(pthid="did:sov:publicdid0000000000000"),
             )
 
@@ -1042,7 +953,6 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
             self.profile.context.update_settings(
                 {"public_invites": True, "debug.auto_accept_requests": False}
             )
-            mock_conn_rec_state_request = ConnRecord.State.REQUEST
             with async_mock.patch.object(
                 test_module, "ConnRecord", async_mock.MagicMock()
             ) as mock_conn_rec_cls, async_mock.patch.object(
@@ -1059,7 +969,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
                 mock_conn_record = async_mock.MagicMock(
                     accept=ConnRecord.ACCEPT_MANUAL,
                     my_did=None,
-                    state=mock_conn_rec_state_request.rfc23,
+                    state=ConnRecord.State.REQUEST.rfc23,
                     attach_request=async_mock.CoroutineMock(),
                     retrieve_request=async_mock.CoroutineMock(),
                     metadata_get_all=async_mock.CoroutineMock(return_value={}),
@@ -1095,14 +1005,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
         async with self.profile.session() as session:
             mock_request = async_mock.MagicMock(
                 did=TestConfig.test_did,
-                did_doc_attach=async_mock.MagicMock(
-                    data=async_mock.MagicMock(
-                        verify=async_mock.CoroutineMock(return_value=True),
-                        signed=async_mock.MagicMock(
-                            decode=async_mock.MagicMock(return_value="dummy-did-doc")
-                        ),
-                    )
-                ),
+                did_doc_attach=make_mock_did_doc_attach("dummy-did-doc"),
                 _thread=async_mock.MagicMock(pthid="dummy-pthid"),
             )
 
@@ -1121,7 +1024,6 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
                     return_value={"test": "value"}
                 ),
             )
-            mock_conn_rec_state_request = ConnRecord.State.REQUEST
 
             await session.wallet.create_local_did(
                 method=DIDMethod.SOV,
@@ -1136,8 +1038,8 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
             ) as mock_conn_rec_cls, async_mock.patch.object(
                 test_module, "DIDDoc", autospec=True
             ) as mock_did_doc, async_mock.patch.object(
-                test_module, "AttachDecorator", autospec=True
-            ) as mock_attach_deco, async_mock.patch.object(
+                test_module, "AttachDecorator", make_mock_attach_deco()
+            ), async_mock.patch.object(
                 test_module, "DIDXResponse", autospec=True
             ) as mock_response:
                 mock_conn_rec_cls.retrieve_by_invitation_key = async_mock.CoroutineMock(
@@ -1146,7 +1048,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
                 mock_conn_rec_cls.return_value = async_mock.MagicMock(
                     accept=ConnRecord.ACCEPT_AUTO,
                     my_did=None,
-                    state=mock_conn_rec_state_request.rfc23,
+                    state=ConnRecord.State.REQUEST.rfc23,
                     attach_request=async_mock.CoroutineMock(),
                     retrieve_request=async_mock.CoroutineMock(),
                     save=async_mock.CoroutineMock(),
@@ -1155,11 +1057,6 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
                 mock_did_doc.from_json = async_mock.MagicMock(
                     return_value=async_mock.MagicMock(did=TestConfig.test_did)
                 )
-                mock_attach_deco.data_base64 = async_mock.MagicMock(
-                    return_value=async_mock.MagicMock(
-                        data=async_mock.MagicMock(sign=async_mock.CoroutineMock())
-                    )
-                )
                 mock_response.return_value = async_mock.MagicMock(
                     assign_thread_from=async_mock.MagicMock(),
                     assign_trace_from=async_mock.MagicMock(),
@@ -1181,10 +1078,6 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
 
     async def test_receive_request_multiuse_multitenant(self):
         async with self.profile.session() as session:
-            multiuse_info = await session.wallet.create_local_did(
-                method=DIDMethod.SOV,
-                key_type=KeyType.ED25519,
-            )
             new_info = await session.wallet.create_local_did(
                 method=DIDMethod.SOV,
                 key_type=KeyType.ED25519,
@@ -1192,14 +1085,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
 
             mock_request = async_mock.MagicMock(
                 did=TestConfig.test_did,
-                did_doc_attach=async_mock.MagicMock(
-                    data=async_mock.MagicMock(
-                        verify=async_mock.CoroutineMock(return_value=True),
-                        signed=async_mock.MagicMock(
-                            decode=async_mock.MagicMock(return_value="dummy-did-doc")
-                        ),
-                    )
-                ),
+                did_doc_attach=make_mock_did_doc_attach("dummy-did-doc"),
                 _thread=async_mock.MagicMock(pthid="dummy-pthid"),
             )
 
@@ -1261,14 +1147,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
 
             mock_request = async_mock.MagicMock(
                 did=TestConfig.test_did,
-                did_doc_attach=async_mock.MagicMock(
-                    data=async_mock.MagicMock(
-                        verify=async_mock.CoroutineMock(return_value=True),
-                        signed=async_mock.MagicMock(
-                            decode=async_mock.MagicMock(return_value="dummy-did-doc")
-                        ),
-                    )
-                ),
+                did_doc_attach=make_mock_did_doc_attach("dummy-did-doc"),
                 _thread=async_mock.MagicMock(pthid="did:sov:publicdid0000000000000"),
             )
 
@@ -1322,13 +1201,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
                 mock_did_doc.from_json = async_mock.MagicMock(
                     return_value=async_mock.MagicMock(did=TestConfig.test_did)
                 )
-                mock_wallet_get_local_did.return_value = DIDInfo(
-                    TestConfig.test_did,
-                    TestConfig.test_verkey,
-                    None,
-                    method=DIDMethod.SOV,
-                    key_type=KeyType.ED25519,
-                )
+                mock_wallet_get_local_did.return_value = TEST_DID_INFO
                 await self.manager.receive_request(
                     request=mock_request,
                     recipient_did=TestConfig.test_did,
@@ -1347,14 +1220,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
         async with self.profile.session() as session:
             mock_request = async_mock.MagicMock(
                 did=TestConfig.test_did,
-                did_doc_attach=async_mock.MagicMock(
-                    data=async_mock.MagicMock(
-                        verify=async_mock.CoroutineMock(return_value=True),
-                        signed=async_mock.MagicMock(
-                            decode=async_mock.MagicMock(return_value="dummy-did-doc")
-                        ),
-                    )
-                ),
+                did_doc_attach=make_mock_did_doc_attach("dummy-did-doc"),
                 _thread=async_mock.MagicMock(pthid="dummy-pthid"),
             )
 
@@ -1392,41 +1258,27 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
         ) as mock_retrieve_req, async_mock.patch.object(
             conn_rec, "save", async_mock.CoroutineMock()
         ) as mock_save, async_mock.patch.object(
-            test_module, "DIDDoc", autospec=True
+            test_module, "DIDDoc", async_mock.MagicMock()
         ) as mock_did_doc, async_mock.patch.object(
-            test_module, "AttachDecorator", autospec=True
-        ) as mock_attach_deco, async_mock.patch.object(
-            test_module, "DIDXResponse", autospec=True
+            test_module, "AttachDecorator", make_mock_attach_deco()
+        ), async_mock.patch.object(
+            test_module, "DIDXResponse", async_mock.MagicMock()
         ) as mock_response, async_mock.patch.object(
             self.manager, "create_did_document", async_mock.CoroutineMock()
         ) as mock_create_did_doc:
             mock_create_did_doc.return_value = async_mock.MagicMock(
                 serialize=async_mock.MagicMock()
             )
-            mock_attach_deco.data_base64 = async_mock.MagicMock(
-                return_value=async_mock.MagicMock(
-                    data=async_mock.MagicMock(sign=async_mock.CoroutineMock())
-                )
-            )
 
             await self.manager.create_response(conn_rec, "http://10.20.30.40:5060/")
 
     async def test_create_response_mediation_id(self):
         async with self.profile.session() as session:
-            mediation_record = MediationRecord(
-                role=MediationRecord.ROLE_CLIENT,
-                state=MediationRecord.STATE_GRANTED,
-                connection_id=self.test_mediator_conn_id,
-                routing_keys=self.test_mediator_routing_keys,
-                endpoint=self.test_mediator_endpoint,
-            )
-            await mediation_record.save(session)
+            mediation_record = await self.make_mediation_record(session)
 
             invi = InvitationMessage(
                 comment="test",
-                handshake_protocols=[
-                    pfx.qualify(HSProto.RFC23.name) for pfx in DIDCommPrefix
-                ],
+                handshake_protocols=RFC23_HANDSHAKE_PROTOCOLS,
                 services=[TestConfig.test_did],
             )
             record = ConnRecord(
@@ -1451,13 +1303,8 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
             ) as mock_conn_save, async_mock.patch.object(
                 record, "metadata_get", async_mock.CoroutineMock(return_value=False)
             ), async_mock.patch.object(
-                test_module, "AttachDecorator", autospec=True
-            ) as mock_attach_deco:
-                mock_attach_deco.data_base64 = async_mock.MagicMock(
-                    return_value=async_mock.MagicMock(
-                        data=async_mock.MagicMock(sign=async_mock.CoroutineMock())
-                    )
-                )
+                test_module, "AttachDecorator", make_mock_attach_deco()
+            ):
                 await self.manager.create_response(
                     record, mediation_id=mediation_record.mediation_id
                 )
@@ -1472,20 +1319,11 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
 
     async def test_create_response_mediation_id_invalid_conn_state(self):
         async with self.profile.session() as session:
-            mediation_record = MediationRecord(
-                role=MediationRecord.ROLE_CLIENT,
-                state=MediationRecord.STATE_GRANTED,
-                connection_id=self.test_mediator_conn_id,
-                routing_keys=self.test_mediator_routing_keys,
-                endpoint=self.test_mediator_endpoint,
-            )
-            await mediation_record.save(session)
+            mediation_record = await self.make_mediation_record(session)
 
             invi = InvitationMessage(
                 comment="test",
-                handshake_protocols=[
-                    pfx.qualify(HSProto.RFC23.name) for pfx in DIDCommPrefix
-                ],
+                handshake_protocols=RFC23_HANDSHAKE_PROTOCOLS,
                 services=[TestConfig.test_did],
             )
             record = ConnRecord(
@@ -1532,27 +1370,16 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
         ), async_mock.patch.object(
             conn_rec, "save", async_mock.CoroutineMock()
         ), async_mock.patch.object(
-            test_module, "AttachDecorator", autospec=True
-        ) as mock_attach_deco, async_mock.patch.object(
+            test_module, "AttachDecorator", make_mock_attach_deco()
+        ), async_mock.patch.object(
             self.manager, "create_did_document", async_mock.CoroutineMock()
         ) as mock_create_did_doc, async_mock.patch.object(
             InMemoryWallet, "create_local_did", autospec=True
         ) as mock_wallet_create_local_did:
-            mock_wallet_create_local_did.return_value = DIDInfo(
-                TestConfig.test_did,
-                TestConfig.test_verkey,
-                None,
-                method=DIDMethod.SOV,
-                key_type=KeyType.ED25519,
-            )
+            mock_wallet_create_local_did.return_value = TEST_DID_INFO
             mock_create_did_doc.return_value = async_mock.MagicMock(
                 serialize=async_mock.MagicMock()
             )
-            mock_attach_deco.data_base64 = async_mock.MagicMock(
-                return_value=async_mock.MagicMock(
-                    data=async_mock.MagicMock(sign=async_mock.CoroutineMock())
-                )
-            )
 
             await self.manager.create_response(conn_rec)
             self.multitenant_mgr.add_key.assert_called_once_with(
@@ -1571,11 +1398,11 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
         ) as mock_retrieve_req, async_mock.patch.object(
             conn_rec, "save", async_mock.CoroutineMock()
         ) as mock_save, async_mock.patch.object(
-            test_module, "DIDDoc", autospec=True
+            test_module, "DIDDoc", async_mock.MagicMock()
         ) as mock_did_doc, async_mock.patch.object(
-            test_module, "AttachDecorator", autospec=True
-        ) as mock_attach_deco, async_mock.patch.object(
-            test_module, "DIDXResponse", autospec=True
+            test_module, "AttachDecorator", make_mock_attach_deco()
+        ), async_mock.patch.object(
+            test_module, "DIDXResponse", async_mock.MagicMock()
         ) as mock_response, async_mock.patch.object(
             self.manager, "create_did_document", async_mock.CoroutineMock()
         ) as mock_create_did_doc, async_mock.patch.object(
@@ -1585,11 +1412,6 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
             mock_create_did_doc.return_value = async_mock.MagicMock(
                 serialize=async_mock.MagicMock()
             )
-            mock_attach_deco.data_base64 = async_mock.MagicMock(
-                return_value=async_mock.MagicMock(
-                    data=async_mock.MagicMock(sign=async_mock.CoroutineMock())
-                )
-            )
 
             await self.manager.create_response(conn_rec, "http://10.20.30.40:5060/")
 
@@ -1609,16 +1431,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
         mock_response = async_mock.MagicMock()
         mock_response._thread = async_mock.MagicMock()
         mock_response.did = TestConfig.test_target_did
-        mock_response.did_doc_attach = async_mock.MagicMock(
-            data=async_mock.MagicMock(
-                verify=async_mock.CoroutineMock(return_value=True),
-                signed=async_mock.MagicMock(
-                    decode=async_mock.MagicMock(
-                        return_value=json.dumps({"dummy": "did-doc"})
-                    )
-                ),
-            )
-        )
+        mock_response.did_doc_attach = make_mock_did_doc_attach(DUMMY_DID_DOC_JSON)
 
         receipt = MessageReceipt(
             recipient_did=TestConfig.test_did,
@@ -1639,16 +1452,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
             )
             mock_conn_retrieve_by_req_id.return_value = async_mock.MagicMock(
                 did=TestConfig.test_target_did,
-                did_doc_attach=async_mock.MagicMock(
-                    data=async_mock.MagicMock(
-                        verify=async_mock.CoroutineMock(return_value=True),
-                        signed=async_mock.MagicMock(
-                            decode=async_mock.MagicMock(
-                                return_value=json.dumps({"dummy": "did-doc"})
-                            )
-                        ),
-                    )
-                ),
+                did_doc_attach=make_mock_did_doc_attach(DUMMY_DID_DOC_JSON),
                 state=ConnRecord.State.REQUEST.rfc23,
                 save=async_mock.CoroutineMock(),
                 metadata_get=async_mock.CoroutineMock(),
@@ -1667,16 +1471,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
         mock_response = async_mock.MagicMock()
         mock_response._thread = async_mock.MagicMock()
         mock_response.did = TestConfig.test_target_did
-        mock_response.did_doc_attach = async_mock.MagicMock(
-            data=async_mock.MagicMock(
-                verify=async_mock.CoroutineMock(return_value=True),
-                signed=async_mock.MagicMock(
-                    decode=async_mock.MagicMock(
-                        return_value=json.dumps({"dummy": "did-doc"})
-                    )
-                ),
-            )
-        )
+        mock_response.did_doc_attach = make_mock_did_doc_attach(DUMMY_DID_DOC_JSON)
 
         receipt = MessageReceipt(
             recipient_did=TestConfig.test_did,
@@ -1700,16 +1495,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
             )
             mock_conn_retrieve_by_req_id.return_value = async_mock.MagicMock(
                 did=TestConfig.test_target_did,
-                did_doc_attach=async_mock.MagicMock(
-                    data=async_mock.MagicMock(
-                        verify=async_mock.CoroutineMock(return_value=True),
-                        signed=async_mock.MagicMock(
-                            decode=async_mock.MagicMock(
-                                return_value=json.dumps({"dummy": "did-doc"})
-                            )
-                        ),
-                    )
-                ),
+                did_doc_attach=make_mock_did_doc_attach(DUMMY_DID_DOC_JSON),
                 state=ConnRecord.State.REQUEST.rfc23,
                 save=async_mock.CoroutineMock(),
                 metadata_get=async_mock.CoroutineMock(),
@@ -1729,16 +1515,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
         mock_response = async_mock.MagicMock()
         mock_response._thread = async_mock.MagicMock()
         mock_response.did = TestConfig.test_target_did
-        mock_response.did_doc_attach = async_mock.MagicMock(
-            data=async_mock.MagicMock(
-                verify=async_mock.CoroutineMock(return_value=True),
-                signed=async_mock.MagicMock(
-                    decode=async_mock.MagicMock(
-                        return_value=json.dumps({"dummy": "did-doc"})
-                    )
-                ),
-            )
-        )
+        mock_response.did_doc_attach = make_mock_did_doc_attach(DUMMY_DID_DOC_JSON)
 
         receipt = MessageReceipt(sender_did=TestConfig.test_target_did)
 
@@ -1757,16 +1534,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
             mock_conn_retrieve_by_req_id.side_effect = StorageNotFoundError()
             mock_conn_retrieve_by_did.return_value = async_mock.MagicMock(
                 did=TestConfig.test_target_did,
-                did_doc_attach=async_mock.MagicMock(
-                    data=async_mock.MagicMock(
-                        verify=async_mock.CoroutineMock(return_value=True),
-                        signed=async_mock.MagicMock(
-                            decode=async_mock.MagicMock(
-                                return_value=json.dumps({"dummy": "did-doc"})
-                            )
-                        ),
-                    )
-                ),
+                did_doc_attach=make_mock_did_doc_attach(DUMMY_DID_DOC_JSON),
                 state=ConnRecord.State.REQUEST.rfc23,
                 save=async_mock.CoroutineMock(),
                 metadata_get=async_mock.CoroutineMock(return_value=False),
@@ -1781,16 +1549,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
         mock_response = async_mock.MagicMock()
         mock_response._thread = async_mock.MagicMock()
         mock_response.did = TestConfig.test_target_did
-        mock_response.did_doc_attach = async_mock.MagicMock(
-            data=async_mock.MagicMock(
-                verify=async_mock.CoroutineMock(return_value=True),
-                signed=async_mock.MagicMock(
-                    decode=async_mock.MagicMock(
-                        return_value=json.dumps({"dummy": "did-doc"})
-                    )
-                ),
-            )
-        )
+        mock_response.did_doc_attach = make_mock_did_doc_attach(DUMMY_DID_DOC_JSON)
 
         receipt = MessageReceipt(sender_did=TestConfig.test_target_did)
 
@@ -1811,16 +1570,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
         mock_response = async_mock.MagicMock()
         mock_response._thread = async_mock.MagicMock()
         mock_response.did = TestConfig.test_target_did
-        mock_response.did_doc_attach = async_mock.MagicMock(
-            data=async_mock.MagicMock(
-                verify=async_mock.CoroutineMock(return_value=True),
-                signed=async_mock.MagicMock(
-                    decode=async_mock.MagicMock(
-                        return_value=json.dumps({"dummy": "did-doc"})
-                    )
-                ),
-            )
-        )
+        mock_response.did_doc_attach = make_mock_did_doc_attach(DUMMY_DID_DOC_JSON)
 
         receipt = MessageReceipt(sender_did=TestConfig.test_target_did)
 
@@ -1851,16 +1601,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
         ) as mock_conn_retrieve_by_req_id:
             mock_conn_retrieve_by_req_id.return_value = async_mock.MagicMock(
                 did=TestConfig.test_target_did,
-                did_doc_attach=async_mock.MagicMock(
-                    data=async_mock.MagicMock(
-                        verify=async_mock.CoroutineMock(return_value=True),
-                        signed=async_mock.MagicMock(
-                            decode=async_mock.MagicMock(
-                                return_value=json.dumps({"dummy": "did-doc"})
-                            )
-                        ),
-                    )
-                ),
+                did_doc_attach=make_mock_did_doc_attach(DUMMY_DID_DOC_JSON),
                 state=ConnRecord.State.REQUEST.rfc23,
                 save=async_mock.CoroutineMock(),
             )
@@ -1872,16 +1613,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
         mock_response = async_mock.MagicMock()
         mock_response._thread = async_mock.MagicMock()
         mock_response.did = TestConfig.test_target_did
-        mock_response.did_doc_attach = async_mock.MagicMock(
-            data=async_mock.MagicMock(
-                verify=async_mock.CoroutineMock(return_value=True),
-                signed=async_mock.MagicMock(
-                    decode=async_mock.MagicMock(
-                        return_value=json.dumps({"dummy": "did-doc"})
-                    )
-                ),
-            )
-        )
+        mock_response.did_doc_attach = make_mock_did_doc_attach(DUMMY_DID_DOC_JSON)
 
         receipt = MessageReceipt(sender_did=TestConfig.test_target_did)
 
@@ -1899,16 +1631,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
             )
             mock_conn_retrieve_by_req_id.return_value = async_mock.MagicMock(
                 did=TestConfig.test_target_did,
-                did_doc_attach=async_mock.MagicMock(
-                    data=async_mock.MagicMock(
-                        verify=async_mock.CoroutineMock(return_value=True),
-                        signed=async_mock.MagicMock(
-                            decode=async_mock.MagicMock(
-                                return_value=json.dumps({"dummy": "did-doc"})
-                            )
-                        ),
-                    )
-                ),
+                did_doc_attach=make_mock_did_doc_attach(DUMMY_DID_DOC_JSON),
                 state=ConnRecord.State.REQUEST.rfc23,
                 save=async_mock.CoroutineMock(),
             )
@@ -1957,14 +1680,6 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
                 await self.manager.accept_complete(mock_complete, receipt)
 
     async def test_create_did_document(self):
-        did_info = DIDInfo(
-            TestConfig.test_did,
-            TestConfig.test_verkey,
-            None,
-            method=DIDMethod.SOV,
-            key_type=KeyType.ED25519,
-        )
-
         mock_conn = async_mock.MagicMock(
             connection_id="dummy",
             inbound_connection_id=None,
@@ -1985,20 +1700,12 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
             mock_conn_rec_retrieve_by_id.return_value = mock_conn
 
             did_doc = await self.manager.create_did_document(
-                did_info=did_info,
+                did_info=TEST_DID_INFO,
                 inbound_connection_id="dummy",
                 svc_endpoints=[TestConfig.test_endpoint],
             )
 
     async def test_create_did_document_not_completed(self):
-        did_info = DIDInfo(
-            TestConfig.test_did,
-            TestConfig.test_verkey,
-            None,
-            method=DIDMethod.SOV,
-            key_type=KeyType.ED25519,
-        )
-
         mock_conn = async_mock.MagicMock(
             connection_id="dummy",
             inbound_connection_id=None,
@@ -2013,20 +1720,12 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
 
             with self.assertRaises(BaseConnectionManagerError):
                 await self.manager.create_did_document(
-                    did_info=did_info,
+                    did_info=TEST_DID_INFO,
                     inbound_connection_id="dummy",
                     svc_endpoints=[TestConfig.test_endpoint],
                 )
 
     async def test_create_did_document_no_services(self):
-        did_info = DIDInfo(
-            TestConfig.test_did,
-            TestConfig.test_verkey,
-            None,
-            method=DIDMethod.SOV,
-            key_type=KeyType.ED25519,
-        )
-
         mock_conn = async_mock.MagicMock(
             connection_id="dummy",
             inbound_connection_id=None,
@@ -2038,8 +1737,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
             did=TestConfig.test_target_did, verkey=TestConfig.test_target_verkey
         )
         x_did_doc._service = {}
-        for i in range(2):  # first cover store-record, then update-value
-            await self.manager.store_did_document(x_did_doc)
+        await self.manager.store_did_document(x_did_doc)
 
         with async_mock.patch.object(
             ConnRecord, "retrieve_by_id", async_mock.CoroutineMock()
@@ -2048,20 +1746,12 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
 
             with self.assertRaises(BaseConnectionManagerError):
                 await self.manager.create_did_document(
-                    did_info=did_info,
+                    did_info=TEST_DID_INFO,
                     inbound_connection_id="dummy",
                     svc_endpoints=[TestConfig.test_endpoint],
                 )
 
     async def test_create_did_document_no_service_endpoint(self):
-        did_info = DIDInfo(
-            TestConfig.test_did,
-            TestConfig.test_verkey,
-            None,
-            method=DIDMethod.SOV,
-            key_type=KeyType.ED25519,
-        )
-
         mock_conn = async_mock.MagicMock(
             connection_id="dummy",
             inbound_connection_id=None,
@@ -2076,8 +1766,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
         x_did_doc.set(
             Service(TestConfig.test_target_did, "dummy", "IndyAgent", [], [], "", 0)
         )
-        for i in range(2):  # first cover store-record, then update-value
-            await self.manager.store_did_document(x_did_doc)
+        await self.manager.store_did_document(x_did_doc)
 
         with async_mock.patch.object(
             ConnRecord, "retrieve_by_id", async_mock.CoroutineMock()
@@ -2086,20 +1775,12 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
 
             with self.assertRaises(BaseConnectionManagerError):
                 await self.manager.create_did_document(
-                    did_info=did_info,
+                    did_info=TEST_DID_INFO,
                     inbound_connection_id="dummy",
                     svc_endpoints=[TestConfig.test_endpoint],
                 )
 
     async def test_create_did_document_no_service_recip_keys(self):
-        did_info = DIDInfo(
-            TestConfig.test_did,
-            TestConfig.test_verkey,
-            None,
-            method=DIDMethod.SOV,
-            key_type=KeyType.ED25519,
-        )
-
         mock_conn = async_mock.MagicMock(
             connection_id="dummy",
             inbound_connection_id=None,
@@ -2122,8 +1803,7 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
                 0,
             )
         )
-        for i in range(2):  # first cover store-record, then update-value
-            await self.manager.store_did_document(x_did_doc)
+        await self.manager.store_did_document(x_did_doc)
 
         with async_mock.patch.object(
             ConnRecord, "retrieve_by_id", async_mock.CoroutineMock()
@@ -2132,20 +1812,12 @@ class TestDidExchangeManager(AsyncTestCase, TestConfig):
 
             with self.assertRaises(BaseConnectionManagerError):
                 await self.manager.create_did_document(
-                    did_info=did_info,
+                    did_info=TEST_DID_INFO,
                     inbound_connection_id="dummy",
                     svc_endpoints=[TestConfig.test_endpoint],
                 )
 
     async def test_did_key_storage(self):
-        did_info = DIDInfo(
-            TestConfig.test_did,
-            TestConfig.test_verkey,
-            None,
-            method=DIDMethod.SOV,
-            key_type=KeyType.ED25519,
-        )
-
         did_doc = self.make_did_doc(
             did=TestConfig.test_target_did, verkey=TestConfig.test_target_verkey
         )
@@ -9,7 +9,6 @@ from aiohttp import (
 )
 import json
 import os
-from time import sleep
 import uuid
 
 from runners.agent_container import AgentContainer, create_agent_with_args_list
@@ -21,40 +20,28 @@ from runners.support.agent import DemoAgent
 ######################################################################
 
 
+_LOOP = None
+
+
+def _event_loop():
+    """Return the event loop shared by all steps, creating it on first use."""
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+        asyncio.set_event_loop(_LOOP)
+    return _LOOP
+
+
 def run_coroutine(coroutine):
-    loop = asyncio.get_event_loop()
-    if not loop:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(coroutine())
-    finally:
-        pass
-        # loop.close()
+    return _event_loop().run_until_complete(coroutine())
 
 
 def run_coroutine_with_args(coroutine, *args):
-    loop = asyncio.get_event_loop()
-    if not loop:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(coroutine(*args))
-    finally:
-        pass
-        # loop.close()
+    return _event_loop().run_until_complete(coroutine(*args))
 
 
 def run_coroutine_with_kwargs(coroutine, *args, **kwargs):
-    loop = asyncio.get_event_loop()
-    if not loop:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(coroutine(*args, **kwargs))
-    finally:
-        pass
-        # loop.close()
+    return _event_loop().run_until_complete(coroutine(*args, **kwargs))
 
 
 def async_sleep(delay):
@@ -68,16 +55,29 @@ def create_agent_container_with_args(in_args: list):
     return run_coroutine_with_args(create_agent_with_args_list, in_args)
 
 
-def aries_container_initialize(
-    the_container: AgentContainer,
+def aries_containers_initialize(
+    the_containers: list,
     schema_name: str = None,
     schema_attrs: list = None,
 ):
-    run_coroutine_with_kwargs(
-        the_container.initialize,
-        schema_name=schema_name,
-        schema_attrs=schema_attrs,
-    )
+    """Initialize several agent containers concurrently."""
+
+    async def _initialize_all():
+        results = await asyncio.gather(
+            *[
+                the_container.initialize(
+                    schema_name=schema_name,
+                    schema_attrs=schema_attrs,
+                )
+                for the_container in the_containers
+            ],
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    run_coroutine(_initialize_all)
 
 
 def agent_container_register_did(
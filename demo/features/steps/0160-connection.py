@@ -14,7 +14,7 @@ import os
 
 from bdd_support.agent_backchannel_client import (
     create_agent_container_with_args,
-    aries_container_initialize,
+    aries_containers_initialize,
     aries_container_generate_invitation,
     aries_container_receive_invitation,
     aries_container_detect_connection,
@@ -73,11 +73,13 @@ def step_impl(context, n):
         # keep reference to the agent so we can shut it down later
         context.active_agents[agent_name]["agent"] = agent
 
-        aries_container_initialize(
-            agent,
-        )
         start_port = start_port + 10
 
+    # each agent uses its own port range, so they can all start up together
+    aries_containers_initialize(
+        [active_agent["agent"] for active_agent in context.active_agents.values()],
+    )
+
 
 @when('"{inviter}" generates a connection invitation')
 def step_impl(context, inviter):